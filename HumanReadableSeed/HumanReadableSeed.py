@@ -1,5 +1,12 @@
 import sys
-from typing import Union, List, Optional, Callable
+from array import array
+from bisect import bisect_left
+from collections.abc import Sequence
+from functools import lru_cache
+from itertools import accumulate
+from math import lcm
+from operator import lshift
+from typing import Union, List, Optional, Callable, Dict, Tuple
 
 try:
     from beartype import beartype as typechecker
@@ -7,60 +14,162 @@ except Exception:
     def typechecker(func: Callable) -> Callable:
         return func
 
-@typechecker
+
+class _PackedWordlist(Sequence):
+    """
+    Read-only sorted wordlist stored as a single ASCII bytes blob plus an array
+    of offsets, instead of one str object per word. Used in memory_saver mode.
+    Only integer indexing is supported.
+    """
+
+    def __init__(self, words: Sequence) -> None:
+        self._blob = ''.join(words).encode('ascii')
+        self._offsets = array('I', accumulate(map(len, words), initial=0))
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i: int) -> str:
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("wordlist index out of range")
+        return self._blob[self._offsets[i]:self._offsets[i + 1]].decode('ascii')
+
+
+# Processed NLTK wordlist and its word to index mapping (if built), shared across
+# instances and keyed by memory_saver
+_NLTK_WORDLIST_CACHE: Dict[bool, Tuple[Union[Tuple[str, ...], _PackedWordlist], Optional[Dict[str, int]]]] = {}
+
+
+@lru_cache(maxsize=None)
+def _make_packers(chunk_size: int) -> Tuple[Callable[[bytes, int], List[int]], Callable[[List[int], int], bytes]]:
+    """
+    Build the pack and unpack functions specialized for chunk_size.
+
+    Bits are processed by groups of lcm(8, chunk_size) bits, which hold a whole
+    number of bytes and of chunks. The shifts of the chunks inside a group are
+    computed once here so each group costs a single int conversion.
+    """
+    group_bits = lcm(8, chunk_size)
+    group_bytes = group_bits // 8
+    shifts = tuple(range(group_bits - chunk_size, -1, -chunk_size))
+    chunks_per_group = len(shifts)
+    mask = (1 << chunk_size) - 1
+
+    def pack(data: bytes, padding_length: int) -> List[int]:
+        """
+        Split the bits of data into chunk_size wide integers, the last chunk
+        being right padded with padding_length zero bits.
+        """
+        n_chunks = (8 * len(data) + padding_length) // chunk_size
+        data = data + bytes(-len(data) % group_bytes)
+        chunks = []
+        for start in range(0, len(data), group_bytes):
+            n = int.from_bytes(data[start:start + group_bytes], 'big')
+            chunks.extend([(n >> shift) & mask for shift in shifts])
+        del chunks[n_chunks:]
+        return chunks
+
+    def unpack(chunks: List[int], padding_length: int) -> bytes:
+        """
+        Inverse of pack: concatenate the bits of the chunks and drop the
+        padding_length trailing padding bits.
+        """
+        byte_len = (len(chunks) * chunk_size - padding_length) // 8
+        chunks = list(chunks) + [0] * (-len(chunks) % chunks_per_group)
+        data = bytearray()
+        for start in range(0, len(chunks), chunks_per_group):
+            # The shifted chunks don't overlap so summing them is the same as or-ing them
+            n = sum(map(lshift, chunks[start:start + chunks_per_group], shifts))
+            data += n.to_bytes(group_bytes, 'big')
+        del data[byte_len:]
+        return bytes(data)
+
+    return pack, unpack
+
+
 class HumanReadableSeed:
     """
     Turns a seed into human readable words and back.
     
     The chunk size used for conversion can be set manually or computed automatically
     based on the size of the wordlist.
+
+    By default words are looked up through a dict mapping each word to its index.
+    With memory_saver=True that dict is not built, the wordlist is stored packed
+    in a single bytes blob and words are looked up by binary search instead.
     """
     __VERSION__: str = "0.0.8"
 
-    def __init__(self, chunk_size: Optional[int] = None, wordlist: Union[str, List[str]] = 'nltk', verbose: bool = False) -> None:
+    @typechecker
+    def __init__(self, chunk_size: Optional[int] = None, wordlist: Union[str, List[str]] = 'nltk', verbose: bool = False, memory_saver: bool = False) -> None:
         self.verbose = verbose
+        self.memory_saver = memory_saver
 
-        if wordlist == 'nltk':
-            import nltk
-            from nltk.corpus import words
-            try:
-                self.wordlist = words.words()
-            except LookupError:
-                print("Downloading 'words' corpus...")
-                nltk.download('words', quiet=True)
-                print("Download complete.")
-                self.wordlist = words.words()
+        # Reuse the processed NLTK wordlist if it was already loaded by another instance
+        if wordlist == 'nltk' and memory_saver in _NLTK_WORDLIST_CACHE:
+            self.wordlist, self._word_to_index = _NLTK_WORDLIST_CACHE[memory_saver]
         else:
-            self.wordlist = list(set(wordlist))
-        
-        # Filter out non-ASCII words and capitalize
-        self.wordlist = [word.title() for word in self.wordlist if all(ord(char) < 128 for char in word)]
-        
-        # Sort the wordlist and remove duplicates
-        self.wordlist = sorted(set(self.wordlist))
-        
-        if '' in self.wordlist:
-            raise ValueError("Wordlist must not contain empty words")
+            if wordlist == 'nltk':
+                import nltk
+                from nltk.corpus import words
+                try:
+                    raw_words = words.words()
+                except LookupError:
+                    print("Downloading 'words' corpus...")
+                    nltk.download('words', quiet=True)
+                    print("Download complete.")
+                    raw_words = words.words()
+            else:
+                raw_words = wordlist
+
+            # Filter out empty and non-ASCII words, capitalize, remove duplicates and sort
+            # The result is immutable as it can be shared between instances
+            self.wordlist = tuple(sorted({word.title() for word in raw_words if word and word.isascii()}))
+
+            if self.memory_saver:
+                self.wordlist = _PackedWordlist(self.wordlist)
+                self._word_to_index = None
+            else:
+                # Map each word to its index for constant time lookups
+                self._word_to_index = {word: i for i, word in enumerate(self.wordlist)}
+
+            if wordlist == 'nltk':
+                _NLTK_WORDLIST_CACHE[memory_saver] = (self.wordlist, self._word_to_index)
 
         if chunk_size is None:
             self.chunk_size = self._compute_chunk_size()
         else:
             self.chunk_size = chunk_size
 
-        if len(self.wordlist) < 2**self.chunk_size:
-            raise ValueError(f"Wordlist must contain at least {2**self.chunk_size} words")
+        # Number of distinct values a chunk can take
+        chunk_capacity = 1 << self.chunk_size
+
+        if len(self.wordlist) < chunk_capacity:
+            raise ValueError(f"Wordlist must contain at least {chunk_capacity} words")
         
+        self._pack, self._unpack = _make_packers(self.chunk_size)
+
         if self.verbose:
             print(f"Wordlist size after filtering and sorting: {len(self.wordlist)}")
 
     def _compute_chunk_size(self) -> int:
-        wordlist_size = len(self.wordlist)
-        chunk_size = 1
-        while 2**chunk_size < wordlist_size:
-            chunk_size += 1
-        return chunk_size - 1  # We want the largest chunk size that doesn't exceed the wordlist size
+        # Same result as the original 2**chunk_size loop, one less than the smallest
+        # chunk size covering the wordlist, so that existing phrases keep decoding
+        return max(1, (len(self.wordlist) - 1).bit_length() - 1)
+
+    def _bisect_index(self, word: str) -> Optional[int]:
+        """
+        Return the index of word in the sorted wordlist found by binary search,
+        or None if absent. Used in memory_saver mode instead of the dict.
+        """
+        i = bisect_left(self.wordlist, word)
+        if i == len(self.wordlist) or self.wordlist[i] != word:
+            return None
+        return i
 
-    def seed_to_human(self, token: str, skip_check: bool = False) -> str:
+    def seed_to_human(self, token: str, skip_check: bool = True) -> str:
         """
         Convert a seed token to human-readable words.
         
@@ -68,43 +177,15 @@ class HumanReadableSeed:
         :param skip_check: If False, perform a roundtrip check
         :return: A string of human-readable words
         """
-        bit_list = ""
-        for i, char in enumerate(token):
-            if ord(char) >= 128:
-                successful_conversion = bit_list
-                raise ValueError(
-                    f"Input token must contain only ASCII characters.\n"
-                    f"Conversion successful up to: '{token[:i]}'\n"
-                    f"Problematic character at position {i}: '{char}' (Unicode: U+{ord(char):04X})\n"
-                    f"Successful bit conversion: {successful_conversion}"
-                )
-            bit_list += format(ord(char), '08b')
-        
-        # Add padding
-        padding_length = (self.chunk_size - (len(bit_list) % self.chunk_size)) % self.chunk_size
-        bit_list += '0' * padding_length
-        
-        # Group bits into chunks
-        chunks = [bit_list[i:i+self.chunk_size] for i in range(0, len(bit_list), self.chunk_size)]
-        
-        # Convert chunks to words
-        words = [self.wordlist[padding_length]]  # Add padding length as the first word
-        for i, chunk in enumerate(chunks):
-            chunk_value = int(chunk, 2)
-            word = self.wordlist[chunk_value]
-            words.append(word)
-            if self.verbose:
-                print(f"Chunk {i+1}: {chunk} -> {chunk_value} -> {word}")
-        
-        result = ' '.join(words)
+        words = self._seed_to_words(token)
         
         if not skip_check:
-            reconstructed = self.human_to_seed(result, skip_check=True)
+            reconstructed = self._words_to_seed(words)
             assert reconstructed == token, f"Roundtrip check failed. Original: {token}, Reconstructed: {reconstructed}"
         
-        return result
+        return ' '.join(words)
 
-    def human_to_seed(self, words: Union[str, List[str]], skip_check: bool = False) -> str:
+    def human_to_seed(self, words: Union[str, List[str]], skip_check: bool = True) -> str:
         """
         Convert human-readable words back to a seed token.
         
@@ -114,46 +195,91 @@ class HumanReadableSeed:
         """
         if isinstance(words, str):
             words = words.split()
-        
-        # Assert that we have at least 2 words (padding length + at least one data word)
-        assert len(words) >= 2, "Input must contain at least 2 words"
 
         # capitalize like in init
         words = [w.title() for w in words]
         
-        # Check that all words are in the wordlist
-        for word in words:
-            assert word in self.wordlist, f"Word '{word}' is not in the wordlist"
-        
-        # Get padding length from the first word and remove it
-        padding_length = self.wordlist.index(words[0])
-        assert padding_length < 64, f"Padding length {padding_length} is too large (should be < 64)"
-        words = words[1:]
-        
-        # Convert words to chunks of bits
-        bit_chunks = []
-        for i, word in enumerate(words):
-            word_index = self.wordlist.index(word)
-            bit_chunk = format(word_index, f'0{self.chunk_size}b')
-            bit_chunks.append(bit_chunk)
-            if self.verbose:
-                print(f"Word {i+1}: {word} -> {word_index} -> {bit_chunk}")
-        
-        # Join all bits and remove padding
-        all_bits = ''.join(bit_chunks)
-        all_bits = all_bits[:-padding_length]
-        
-        # Convert to characters
-        token = ''.join(chr(int(all_bits[i:i+8], 2)) for i in range(0, len(all_bits), 8))
+        token = self._words_to_seed(words)
         
         if not skip_check:
-            reconstructed = self.seed_to_human(token, skip_check=True)
-            original_words = ' '.join(words)
-            reconstructed_words = ' '.join(reconstructed.split()[1:])  # Remove padding length word
-            assert reconstructed_words == original_words, f"Roundtrip check failed. Original: {original_words}, Reconstructed: {reconstructed_words}"
+            # Compare without the padding length word
+            reconstructed = self._seed_to_words(token)[1:]
+            assert reconstructed == words[1:], f"Roundtrip check failed. Original: {' '.join(words[1:])}, Reconstructed: {' '.join(reconstructed)}"
         
         return token
 
+    def _seed_to_words(self, token: str) -> List[str]:
+        """
+        Convert a seed token to a list of words, the first one encoding the
+        padding length.
+        """
+        if not token:
+            raise ValueError("Input token must not be empty")
+        if not token.isascii():
+            # Only look for the offending character on the error path
+            i, char = next((i, char) for i, char in enumerate(token) if ord(char) >= 128)
+            raise ValueError(
+                f"Input token must contain only ASCII characters.\n"
+                f"Conversion successful up to: '{token[:i]}'\n"
+                f"Problematic character at position {i}: '{char}' (Unicode: U+{ord(char):04X})"
+            )
+        data = token.encode('ascii')
+        
+        # Compute padding and group bits into chunks
+        padding_length = (-8 * len(data)) % self.chunk_size
+        chunks = self._pack(data, padding_length)
+        
+        # Convert chunks to words, adding padding length as the first word
+        wordlist = self.wordlist
+        words = [wordlist[padding_length]] + [wordlist[chunk_value] for chunk_value in chunks]
+        
+        if self.verbose:
+            fmt = f'0{self.chunk_size}b'
+            for i, (chunk_value, word) in enumerate(zip(chunks, words[1:])):
+                print(f"Chunk {i+1}: {format(chunk_value, fmt)} -> {chunk_value} -> {word}")
+        
+        return words
+
+    def _words_to_seed(self, words: List[str]) -> str:
+        """
+        Convert a list of capitalized words, the first one encoding the padding
+        length, back to a seed token.
+        """
+        # Check that we have at least 2 words (padding length + at least one data word)
+        if len(words) < 2:
+            raise ValueError("Input must contain at least 2 words")
+        
+        # Get the indexes and check that all words are in the wordlist
+        if self.memory_saver:
+            indexes = [self._bisect_index(word) for word in words]
+        else:
+            indexes = list(map(self._word_to_index.get, words))
+        missing = [word for word, idx in zip(words, indexes) if idx is None]
+        if missing:
+            raise ValueError(f"Words not in the wordlist: {', '.join(repr(word) for word in missing)}")
+        
+        # Get padding length from the first word and remove it
+        padding_length = indexes[0]
+        if padding_length >= self.chunk_size:
+            raise ValueError(f"Padding length {padding_length} is too large (should be < {self.chunk_size})")
+        indexes = indexes[1:]
+        
+        # The bits left once the padding is removed must form whole bytes
+        data_bits = len(indexes) * self.chunk_size - padding_length
+        if data_bits % 8 != 0:
+            raise ValueError(f"Words encode {data_bits} bits after removing padding, which is not a whole number of bytes")
+        
+        if self.verbose:
+            fmt = f'0{self.chunk_size}b'
+            for i, (word, word_index) in enumerate(zip(words[1:], indexes)):
+                print(f"Word {i+1}: {word} -> {word_index} -> {format(word_index, fmt)}")
+        
+        # Remove padding and convert to characters
+        return self._unpack(indexes, padding_length).decode('ascii')
+
+# Instances created by launcher, keyed by verbose
+_INSTANCES: Dict[bool, HumanReadableSeed] = {}
+
 @typechecker
 def launcher(
         action: str,
@@ -162,16 +288,21 @@ def launcher(
     ) -> str:
     """Usage: HumanReadableSeed [toseed|toread] "<input_data>" [--verbose]
     Or likewise with python -m HumanReadableSeed"""
-    hrs = HumanReadableSeed(verbose=verbose)
+    # Handle the actions that don't need the wordlist before loading it
+    if action == "--version":
+        return f"HumanReadableSeed version: {HumanReadableSeed.__VERSION__}"
+    elif action not in ("toseed", "toread"):
+        raise ValueError("Invalid action. Use 'toseed' or 'toread'.")
+
+    # Reuse the instance of previous calls made from the same process
+    if verbose not in _INSTANCES:
+        _INSTANCES[verbose] = HumanReadableSeed(verbose=verbose)
+    hrs = _INSTANCES[verbose]
     
     if action == "toseed":
         return hrs.human_to_seed(input_data)
-    elif action == "toread":
-        return hrs.seed_to_human(input_data)
-    elif action == "--version":
-        return f"HumanReadableSeed version: {HumanReadableSeed.__VERSION__}"
     else:
-        raise ValueError("Invalid action. Use 'toseed' or 'toread'.")
+        return hrs.seed_to_human(input_data)
 
 
 def cli_launcher():
@@ -179,6 +310,7 @@ def cli_launcher():
         print(f"HumanReadableSeed version: {HumanReadableSeed.__VERSION__}")
         sys.exit(0)
 
+    # fire is only needed to parse the arguments of an actual conversion
     import fire
     try:
         fire.Fire(launcher)
@@ -219,15 +351,24 @@ if __name__ == "__main__":
                     print(f"Position {i}: Original '{original}' != Reconstructed '{reconstructed}'")
             raise AssertionError("Roundtrip failed")
 
+    # An empty seed can't be decoded back so it must be rejected
+    try:
+        hrs.seed_to_human("")
+    except ValueError as e:
+        print(f"Empty seed rejected: {e}")
+    else:
+        raise AssertionError("Empty seed was not rejected")
+
     # Test with varying seed lengths, from largest to smallest
     n_test = 10
     seed_lengths = [500, 450, 400, 300, 200, 100, 50, 20, 10, 5]
     for i in range(n_test):
         for length in seed_lengths:
             test_human_readable_seed(length, skip_check=True)
+            test_human_readable_seed(length, skip_check=False)
 
             # do a test with the included checks
             # Generate a random ASCII seed
             seed = ''.join(random.choice(string.ascii_letters + string.digits) for _ in range(length))
             print(f"Original seed: {seed}")
-            hrs.seed_to_human(seed)
+            hrs.seed_to_human(seed, skip_check=False)